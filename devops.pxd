@@ -0,0 +1,7 @@
+# Cython declarations for devops.py, picked up automatically by `python setup.py build_ext`.
+# devops.py itself stays plain Python, so it still runs without Cython.
+
+import cython
+
+@cython.locals(bugs=dict, bug=dict, work_item=dict, api_url=str, html_url=str)
+cpdef dict get_work_item(str bug_id, str organization=*, str project=*, str pat=*)
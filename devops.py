@@ -16,134 +16,179 @@ import json
 import argparse
 import datetime
 import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+# orjson is an optional speedup; fall back to the standard library if it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Data files live next to this script; resolve their paths once
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_BUGS_FILE = os.path.join(_SCRIPT_DIR, 'bugs.json')
+_BUGS_CACHE_FILE = _BUGS_FILE + '.cache.pkl'
+_SAMPLES_FILE = os.path.join(_SCRIPT_DIR, 'sample_work_items.json')
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON, using the standard library for inputs orjson rejects (e.g. NaN, big integers)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON, using the standard library for values orjson rejects"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    # Emit raw UTF-8 like orjson so output doesn't depend on which library is installed
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Map severity string to an index into _PRIORITIES (unrecognized severities default to Medium)
+_SEV_INDEX = {
+    "Critical": 0,
+    "High": 1,
+    "Medium": 2,
+    "Low": 3
+}
+_PRIORITIES = (1, 2, 3, 4)
+
+# Identities used for generated work items. These are shared between work items
+# rather than rebuilt per call, so treat them as read-only.
+_DEFAULT_USER_ID = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+_DEFAULT_CREATED_BY = {
+    "displayName": "Bug Creator",
+    "uniqueName": "bug.creator@company.com",
+    "id": _DEFAULT_USER_ID
+}
+_DEFAULT_SYSTEM_USER = {
+    "displayName": "System",
+    "uniqueName": "system@company.com",
+    "id": _DEFAULT_USER_ID
+}
+
+# Bump when the shape of the cached bug index changes
+_CACHE_VERSION = 3
+
+
+def _read_bugs_cache(cache_file_path: str, cache_key: tuple) -> Optional[Dict[str, Dict]]:
+    """Return the cached bug index if it was built from the current bugs.json"""
+    try:
+        with open(cache_file_path, 'rb') as f:
+            if pickle.load(f) != cache_key:
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_bugs_cache(cache_file_path: str, cache_key: tuple, bugs_dict: Dict[str, Dict]) -> None:
+    """Atomically write the bug index to the cache file, ignoring write failures"""
+    tmp_file_path = f"{cache_file_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file_path, 'wb') as f:
+            pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(bugs_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file_path, cache_file_path)
+    except OSError:
+        try:
+            os.remove(tmp_file_path)
+        except OSError:
+            pass
+
+
+def _prepare_bug(bug: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute derived fields used by get_work_item, once per loaded bug"""
+    severity = bug.get('severity')
+    bug['_sev_idx'] = _SEV_INDEX.get(severity, 2) if isinstance(severity, str) else 2
+    # Tolerate missing or non-string assignees so one bad record can't break the whole index
+    assignee = bug.get('assignedTo') or 'Unassigned'
+    bug['_assigned_display'] = assignee
+    bug['_assigned_email'] = str(assignee).lower().replace(' ', '.') + '@company.com'
+    return bug
+
+
 # Load bugs from bugs.json
 
 
 def load_bugs_from_json() -> Dict[str, Dict]:
     try:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        bugs_file_path = os.path.join(script_dir, 'bugs.json')
+        # Reuse the parsed bugs if bugs.json has not changed since the last run
+        stat = os.stat(_BUGS_FILE)
+        cache_key = (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+        bugs_dict = _read_bugs_cache(_BUGS_CACHE_FILE, cache_key)
+        if bugs_dict is not None:
+            return bugs_dict
 
-        with open(bugs_file_path, 'r') as f:
-            data = json.load(f)
+        # Read the whole file in one go and hand the bytes straight to the parser
+        data = _loads(Path(_BUGS_FILE).read_bytes())
 
         # Convert the list of bugs to a dictionary with bug ID as the key
-        bugs_dict = {}
-        for bug in data.get('bugs', []):
-            bug_id = bug.get('id')
-            if bug_id:
-                bugs_dict[bug_id] = bug
+        bugs_dict = {bug['id']: _prepare_bug(bug) for bug in data.get('bugs', ()) if bug.get('id')}
 
+        _write_bugs_cache(_BUGS_CACHE_FILE, cache_key, bugs_dict)
         return bugs_dict
     except Exception as e:
         print(f"Error loading bugs.json: {e}")
         return {}
 
 
-# Load bugs from the JSON file
-BUGS = load_bugs_from_json()
+@lru_cache(maxsize=1)
+def _bugs() -> Dict[str, Dict]:
+    """Load bugs from the JSON file on first use and reuse them afterwards"""
+    return load_bugs_from_json()
+
+
+@lru_cache(maxsize=1)
+def _now_iso() -> str:
+    """Timestamp used for generated work items, computed once per process"""
+    return datetime.datetime.now().isoformat()
+
 
 # Sample work items structure to maintain compatibility with existing code
-SAMPLE_WORK_ITEMS = {
-    "12345": {
-        "id": 12345,
-        "rev": 5,
-        "fields": {
-            "System.Id": 12345,
-            "System.Title": "Fix pagination issue on record list",
-            "System.State": "Active",
-            "System.CreatedDate": "2025-05-15T09:30:45.123Z",
-            "System.CreatedBy": {
-                "displayName": "Brad Johnson",
-                "uniqueName": "brad.johnson@company.com",
-                "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-            },
-            "System.AssignedTo": {
-                "displayName": "Brad Johnson",
-                "uniqueName": "brad.johnson@company.com",
-                "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-            },
-            "System.WorkItemType": "User Story",
-            "System.Description": "Users are reporting that the pagination controls don't work correctly on the record list page. When clicking to the next page, the same records are shown again.",
-            "System.Tags": "Bug, Frontend, UI",
-            "Microsoft.VSTS.Common.Priority": 2,
-            "Microsoft.VSTS.Common.Severity": "2 - Medium",
-            "Custom.Department": "Engineering",
-            "Custom.EstimatedHours": 4.5
-        },
-        "relations": [
-            {
-                "rel": "System.LinkTypes.Hierarchy-Forward",
-                "url": "https://dev.azure.com/organization/project/_apis/wit/workItems/12346",
-                "attributes": {
-                    "name": "Child"
-                }
-            }
-        ],
-        "_links": {
-            "self": {
-                "href": "https://dev.azure.com/organization/project/_apis/wit/workItems/12345"
-            },
-            "workItemUpdates": {
-                "href": "https://dev.azure.com/organization/project/_apis/wit/workItems/12345/updates"
-            },
-            "html": {
-                "href": "https://dev.azure.com/organization/project/_workitems/edit/12345"
-            }
-        },
-        "url": "https://dev.azure.com/organization/project/_apis/wit/workItems/12345"
-    },
-    "54321": {
-        "id": 54321,
-        "rev": 3,
+@lru_cache(maxsize=1)
+def _samples() -> Dict[str, Dict]:
+    """Load the sample work items from sample_work_items.json on first use"""
+    try:
+        return _loads(Path(_SAMPLES_FILE).read_bytes())
+    except Exception as e:
+        print(f"Error loading sample_work_items.json: {e}")
+        return {}
+
+
+def _unknown_work_item(bug_id: str, organization: str, project: str) -> Dict[str, Any]:
+    """Generate a placeholder work item for an ID that doesn't match any known bug or sample"""
+    return {
+        "id": bug_id,
+        "rev": 1,
         "fields": {
-            "System.Id": 54321,
-            "System.Title": "Implement user authentication with OAuth",
+            "System.Id": bug_id,
+            "System.Title": f"Unknown bug {bug_id}",
             "System.State": "New",
-            "System.CreatedDate": "2025-05-10T14:22:33.456Z",
-            "System.CreatedBy": {
-                "displayName": "Jane Smith",
-                "uniqueName": "jane.smith@company.com",
-                "id": "z9y8x7w6-v5u4-3210-9876-543210fedcba"
-            },
-            "System.AssignedTo": {
-                "displayName": "Brad Johnson",
-                "uniqueName": "brad.johnson@company.com",
-                "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-            },
-            "System.WorkItemType": "Feature",
-            "System.Description": "Implement OAuth 2.0 authentication flow for the application to allow users to sign in with their Google, Microsoft, or Facebook accounts.",
-            "System.Tags": "Security, Authentication, Backend",
-            "Microsoft.VSTS.Common.Priority": 1,
-            "Microsoft.VSTS.Common.Severity": "1 - Critical",
-            "Custom.Department": "Security",
-            "Custom.EstimatedHours": 16.0
+            "System.CreatedDate": _now_iso(),
+            "System.CreatedBy": _DEFAULT_SYSTEM_USER,
+            "System.WorkItemType": "Bug",
+            "System.Description": f"No bug found with ID {bug_id}.",
+            "Microsoft.VSTS.Common.Priority": 3
         },
-        "relations": [
-            {
-                "rel": "System.LinkTypes.Hierarchy-Reverse",
-                "url": "https://dev.azure.com/organization/project/_apis/wit/workItems/54310",
-                "attributes": {
-                    "name": "Parent"
-                }
-            }
-        ],
         "_links": {
             "self": {
-                "href": "https://dev.azure.com/organization/project/_apis/wit/workItems/54321"
-            },
-            "workItemUpdates": {
-                "href": "https://dev.azure.com/organization/project/_apis/wit/workItems/54321/updates"
-            },
-            "html": {
-                "href": "https://dev.azure.com/organization/project/_workitems/edit/54321"
+                "href": f"https://dev.azure.com/{organization}/{project}/_apis/wit/workItems/{bug_id}"
             }
-        },
-        "url": "https://dev.azure.com/organization/project/_apis/wit/workItems/54321"
+        }
     }
-}
 
 
 def get_work_item(bug_id: str, organization: str = "organization", project: str = "project", pat: Optional[str] = None) -> Dict[str, Any]:
@@ -160,8 +205,13 @@ def get_work_item(bug_id: str, organization: str = "organization", project: str
         Dictionary containing bug details in a work item format
     """
     # Check if the bug ID exists in our loaded bugs
-    if bug_id in BUGS:
-        bug = BUGS[bug_id]
+    bugs = _bugs()
+    if bug_id in bugs:
+        bug = bugs[bug_id]
+
+        # Work item URLs shared by the fields below
+        api_url = f"https://dev.azure.com/{organization}/{project}/_apis/wit/workItems/{bug_id}"
+        html_url = f"https://dev.azure.com/{organization}/{project}/_workitems/edit/{bug_id}"
 
         # Convert bug format to match Azure DevOps work item format
         work_item = {
@@ -171,21 +221,17 @@ def get_work_item(bug_id: str, organization: str = "organization", project: str
                 "System.Id": bug_id,
                 "System.Title": bug.get("title", "No Title"),
                 "System.State": bug.get("status", "Unknown"),
-                "System.CreatedDate": datetime.datetime.now().isoformat(),
-                "System.CreatedBy": {
-                    "displayName": "Bug Creator",
-                    "uniqueName": "bug.creator@company.com",
-                    "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-                },
+                "System.CreatedDate": _now_iso(),
+                "System.CreatedBy": _DEFAULT_CREATED_BY,
                 "System.AssignedTo": {
-                    "displayName": bug.get("assignedTo", "Unassigned"),
-                    "uniqueName": f"{bug.get('assignedTo', 'unassigned').lower().replace(' ', '.')}@company.com",
-                    "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+                    "displayName": bug["_assigned_display"],
+                    "uniqueName": bug["_assigned_email"],
+                    "id": _DEFAULT_USER_ID
                 },
                 "System.WorkItemType": "Bug",
                 "System.Description": bug.get("description", "No description"),
                 "System.Tags": bug.get("severity", "Unknown"),
-                "Microsoft.VSTS.Common.Priority": _map_severity_to_priority(bug.get("severity", "Unknown")),
+                "Microsoft.VSTS.Common.Priority": _PRIORITIES[bug["_sev_idx"]],
                 "Microsoft.VSTS.Common.Severity": bug.get("severity", "Unknown"),
                 "Custom.Location": bug.get("location", "Unknown"),
                 "Custom.LineNumbers": bug.get("lineNumbers", []),
@@ -196,59 +242,44 @@ def get_work_item(bug_id: str, organization: str = "organization", project: str
             },
             "_links": {
                 "self": {
-                    "href": f"https://dev.azure.com/{organization}/{project}/_apis/wit/workItems/{bug_id}"
+                    "href": api_url
                 },
                 "html": {
-                    "href": f"https://dev.azure.com/{organization}/{project}/_workitems/edit/{bug_id}"
+                    "href": html_url
                 }
             },
-            "url": f"https://dev.azure.com/{organization}/{project}/_apis/wit/workItems/{bug_id}"
+            "url": api_url
         }
         return work_item
-    elif bug_id in SAMPLE_WORK_ITEMS:
+    elif bug_id in _samples():
         # Return from the original sample work items if bug not found but ID matches
-        return SAMPLE_WORK_ITEMS[bug_id]
+        return _samples()[bug_id]
     else:
-        # Generate a fake work item if ID doesn't match any known bug or sample
-        return {
-            "id": bug_id,
-            "rev": 1,
-            "fields": {
-                "System.Id": bug_id,
-                "System.Title": f"Unknown bug {bug_id}",
-                "System.State": "New",
-                "System.CreatedDate": datetime.datetime.now().isoformat(),
-                "System.CreatedBy": {
-                    "displayName": "System",
-                    "uniqueName": "system@company.com",
-                    "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-                },
-                "System.WorkItemType": "Bug",
-                "System.Description": f"No bug found with ID {bug_id}.",
-                "Microsoft.VSTS.Common.Priority": 3
-            },
-            "_links": {
-                "self": {
-                    "href": f"https://dev.azure.com/{organization}/{project}/_apis/wit/workItems/{bug_id}"
-                }
-            }
-        }
+        return _unknown_work_item(bug_id, organization, project)
 
 
-def _map_severity_to_priority(severity: str) -> int:
-    """Map severity string to a priority number"""
-    severity_map = {
-        "Critical": 1,
-        "High": 2,
-        "Medium": 3,
-        "Low": 4
-    }
-    # Default to 3 (Medium) if severity not recognized
-    return severity_map.get(severity, 3)
+def _print_json(work_item: Dict[str, Any]) -> None:
+    """Write a work item to stdout as indented JSON, skipping the text encoding layer when possible"""
+    data = _dumps(work_item)
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is None:
+        # stdout has been replaced by a text-only stream (e.g. io.StringIO)
+        sys.stdout.write(data.decode('utf-8') + "\n")
+        return
+
+    # Flush any pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    out.write(data)
+    out.write(b"\n")
 
 
 def main():
     """Main function to handle command-line arguments and fetch bug data."""
+    # Fast path for the common `devops.py BUG-001` call: skip building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] and not sys.argv[1].startswith('-'):
+        _print_json(get_work_item(sys.argv[1]))
+        return
+
     parser = argparse.ArgumentParser(
         description='Retrieve bug information from bugs.json')
     parser.add_argument('bug_id', nargs='?',
@@ -268,15 +299,18 @@ def main():
 
     # If --list flag is provided, list all available bugs
     if args.list:
-        if not BUGS:
+        bugs = _bugs()
+        if not bugs:
             print("No bugs found in bugs.json")
             return
 
-        print("\nAvailable Bugs:")
-        print("-" * 80)
-        for bug_id, bug in BUGS.items():
-            print(f"{bug_id}: {bug.get('title', 'No Title')} - {bug.get('severity', 'Unknown')} - {bug.get('status', 'Unknown')}")
-        print()
+        # Build the whole listing first and write it out in one call
+        lines = ["\nAvailable Bugs:", "-" * 80]
+        lines.extend(
+            f"{bug_id}: {bug.get('title', 'No Title')} - {bug.get('severity', 'Unknown')} - {bug.get('status', 'Unknown')}"
+            for bug_id, bug in bugs.items())
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
 
     # Ensure bug_id is provided if not using --list
@@ -291,41 +325,42 @@ def main():
     if args.format == 'summary':
         try:
             fields = work_item['fields']
-            # Print a summary of the work item
-            print(f"\nBug #{fields['System.Id']} - {fields['System.Title']}")
-            print("-" * 80)
-            print(f"Status:      {fields.get('System.State', 'Unknown')}")
-            print(
-                f"Severity:    {fields.get('Microsoft.VSTS.Common.Severity', 'Unknown')}")
-            print(
-                f"Assigned to: {fields.get('System.AssignedTo', {}).get('displayName', 'Unassigned')}")
-            print(f"Location:    {fields.get('Custom.Location', 'Unknown')}")
+            # Build a summary of the work item and write it out in one call
+            buf = []
+            w = buf.append
+            w(f"\nBug #{fields['System.Id']} - {fields['System.Title']}")
+            w("-" * 80)
+            w(f"Status:      {fields.get('System.State', 'Unknown')}")
+            w(f"Severity:    {fields.get('Microsoft.VSTS.Common.Severity', 'Unknown')}")
+            w(f"Assigned to: {fields.get('System.AssignedTo', {}).get('displayName', 'Unassigned')}")
+            w(f"Location:    {fields.get('Custom.Location', 'Unknown')}")
             if 'Custom.LineNumbers' in fields and fields['Custom.LineNumbers']:
-                print(
-                    f"Line(s):     {', '.join(map(str, fields['Custom.LineNumbers']))}")
+                w(f"Line(s):     {', '.join(map(str, fields['Custom.LineNumbers']))}")
 
-            print("\nDescription:")
-            print(fields.get('System.Description', 'No description'))
+            w("\nDescription:")
+            w(str(fields.get('System.Description', 'No description')))
 
             if 'Custom.Steps' in fields and fields['Custom.Steps']:
-                print("\nSteps to Reproduce:")
+                w("\nSteps to Reproduce:")
                 for i, step in enumerate(fields['Custom.Steps'], 1):
-                    print(f"{i}. {step}")
+                    w(f"{i}. {step}")
+
+            w("\nExpected Behavior:")
+            w(str(fields.get('Custom.ExpectedBehavior', 'Not specified')))
 
-            print("\nExpected Behavior:")
-            print(fields.get('Custom.ExpectedBehavior', 'Not specified'))
+            w("\nActual Behavior:")
+            w(str(fields.get('Custom.ActualBehavior', 'Not specified')))
 
-            print("\nActual Behavior:")
-            print(fields.get('Custom.ActualBehavior', 'Not specified'))
+            w("\nProposed Fix:")
+            w(str(fields.get('Custom.Fix', 'No fix proposed')))
 
-            print("\nProposed Fix:")
-            print(fields.get('Custom.Fix', 'No fix proposed'))
+            sys.stdout.write("\n".join(buf) + "\n")
 
         except KeyError as e:
             print(f"Error parsing bug data: {e}")
     else:
         # Print full JSON output
-        print(json.dumps(work_item, indent=2))
+        _print_json(work_item)
 
 
 if __name__ == "__main__":
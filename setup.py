@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+"""
+Optional Cython build for devops.py
+
+Compiles devops.py into a C extension module so that `import devops` (for example
+from other tooling calling get_work_item) uses compiled code. C types for the hot
+paths are declared in devops.pxd, which Cython picks up alongside devops.py. The
+devops.py source is left untouched and remains the pure-Python fallback, so
+`python devops.py` keeps working without a compiler.
+
+Usage:
+    python setup.py build_ext --inplace
+
+Requirements:
+    - Cython library: pip install cython
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit(
+        "Error: Cython is required to build the extension. Install it using:\n  pip install cython")
+
+setup(
+    name="devops",
+    ext_modules=cythonize(
+        ["devops.py"], compiler_directives={"language_level": "3"}),
+)